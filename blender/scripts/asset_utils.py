@@ -0,0 +1,88 @@
+"""
+Tower Game - Shared Asset Pipeline Helpers
+File discovery, hashing, JSON output and object partitioning used by
+batch_export.py and validate_models.py.
+
+Does not import bpy or the export settings, so importing it costs nothing
+beyond the standard library and the optional accelerators below.
+"""
+
+import os
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    from blake3 import blake3
+except ImportError:  # Not bundled with Blender; fall back to xxhash/hashlib
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:  # Not bundled with Blender; fall back to hashlib
+    xxhash = None
+
+try:
+    import orjson
+except ImportError:  # Not bundled with Blender; fall back to json
+    orjson = None
+
+
+# Threads used to hash .blend files; hashing is I/O bound
+HASH_WORKERS = os.cpu_count() or 1
+
+
+def iter_blends(root: Path):
+    """Yield os.DirEntry for every .blend file under root, depth first."""
+    stack = [root] if root.is_dir() else []
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".blend"):
+                    yield entry
+
+
+def dump_json(data, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+
+def file_digest(path: Path) -> str:
+    """Content hash of a file, prefixed with the algorithm that produced it."""
+    if blake3 is not None:
+        # Memory-mapped, GIL released; single-threaded because digest_files
+        # already hashes one file per pool thread
+        return "blake3:" + blake3().update_mmap(path).hexdigest()
+
+    if xxhash is not None:
+        algo, hasher = "xxh64", xxhash.xxh64()
+    else:
+        algo, hasher = "blake2b", hashlib.blake2b(digest_size=16)
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+
+    return f"{algo}:{hasher.hexdigest()}"
+
+
+def digest_files(paths) -> dict:
+    """Hash many files concurrently; maps each path to its file_digest()."""
+    paths = list(paths)
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+        return dict(zip(paths, pool.map(file_digest, paths)))
+
+
+def objects_by_type(objects, *types) -> dict:
+    """Partition objects into per-type lists in a single pass."""
+    buckets = {obj_type: [] for obj_type in types}
+    for obj in objects:
+        bucket = buckets.get(obj.type)
+        if bucket is not None:
+            bucket.append(obj)
+    return buckets
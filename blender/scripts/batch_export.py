@@ -8,12 +8,21 @@ Usage:
 """
 
 import bpy
+import numpy as np
 import os
 import sys
 import json
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+# Blender does not put the script directory on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from asset_utils import digest_files, dump_json, iter_blends, objects_by_type  # noqa: E402
+from blender_client import WorkerError, WorkerPool  # noqa: E402
+
 
 # === Configuration ===
 
@@ -22,6 +31,18 @@ SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 PROJECT_ROOT = SCRIPT_DIR.parent.parent
 MODELS_DIR = SCRIPT_DIR.parent / "models"
 EXPORT_DIR = PROJECT_ROOT / "ue5-client" / "Content" / "Models" / "Imported"
+EXPORT_CACHE_PATH = EXPORT_DIR / ".export_cache.json"
+REPORT_PATH = EXPORT_DIR / "export_report.json"
+
+# Number of persistent headless Blender processes used for export
+EXPORT_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+# Operators resolved once; every bpy.ops attribute access is an RNA lookup
+try:
+    _EXPORT_FBX = bpy.ops.export_scene.fbx
+    _OPEN_MAINFILE = bpy.ops.wm.open_mainfile
+except AttributeError:  # bpy stub without operators (docs builds, linters)
+    _EXPORT_FBX = _OPEN_MAINFILE = None
 
 # UE5 FBX export settings
 UE5_EXPORT_SETTINGS = {
@@ -59,6 +80,41 @@ UE5_EXPORT_SETTINGS = {
     "use_batch_own_dir": True,
 }
 
+
+def _fbx_operator_params() -> set:
+    """Names of the properties accepted by the FBX export operator."""
+    try:
+        return set(_EXPORT_FBX.get_rna_type().properties.keys())
+    except (AttributeError, KeyError, RuntimeError):
+        # FBX add-on not registered yet: forward settings unfiltered
+        return set(UE5_EXPORT_SETTINGS)
+
+
+# Export kwargs built once, restricted to what this Blender version accepts
+_FBX_OP_PARAMS = _fbx_operator_params()
+_FBX_KWARGS = {k: v for k, v in UE5_EXPORT_SETTINGS.items() if k in _FBX_OP_PARAMS}
+
+# Files with no rig or animation skip armatures and the whole action-baking pass
+_KWARGS_SKELETAL = _FBX_KWARGS
+_KWARGS_STATIC = {**_FBX_KWARGS, "bake_anim": False, "object_types": {"MESH", "EMPTY"}}
+
+
+def _compile_exporter(name: str, fbx_kwargs: dict):
+    """Generate an export function with the operator kwargs inlined as constants.
+
+    The generated source is `_EXPORT_FBX(filepath=filepath, key=value, ...)`,
+    so a call pays no dict lookups or kwargs merging.
+    """
+    args = "".join(f", {k}={v!r}" for k, v in fbx_kwargs.items())
+    source = f"def {name}(filepath):\n    _EXPORT_FBX(filepath=filepath{args})\n"
+    namespace = {"_EXPORT_FBX": _EXPORT_FBX}
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_export_skeletal = _compile_exporter("_export_skeletal", _KWARGS_SKELETAL)
+_export_static = _compile_exporter("_export_static", _KWARGS_STATIC)
+
 # Asset categories for organized export
 ASSET_CATEGORIES = {
     "characters": "Characters",
@@ -71,12 +127,17 @@ ASSET_CATEGORIES = {
     "ui": "UI",
 }
 
+# Categories always exported with armatures and baked animation
+SKELETAL_CATEGORIES = {"Characters", "Monsters"}
+SKELETAL_PREFIX = "SK_"
+
 
 def ensure_dir(path: Path):
     """Create directory if it doesn't exist."""
     path.mkdir(parents=True, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=None)
 def get_category(filepath: Path) -> str:
     """Determine asset category from file path or name."""
     name_lower = filepath.stem.lower()
@@ -89,9 +150,41 @@ def get_category(filepath: Path) -> str:
     return "Misc"
 
 
-def clean_scene():
-    """Remove all objects from the current scene."""
-    bpy.ops.wm.read_homefile(use_empty=True)
+def load_export_cache() -> dict:
+    """Load fingerprints of previously exported files."""
+    try:
+        with open(EXPORT_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_export_cache(cache: dict):
+    """Write the export cache atomically so an interrupted run can't corrupt it."""
+    tmp_path = EXPORT_CACHE_PATH.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(dump_json(cache))
+    os.replace(tmp_path, EXPORT_CACHE_PATH)
+
+
+def exporter_for(blend_path: Path, category: str):
+    """FBX export function for the currently opened file.
+
+    The category is only a hint: a file keeps the skeletal preset whenever
+    it has armatures or actions, or follows the SK_ naming convention.
+    """
+    if (category in SKELETAL_CATEGORIES
+            or blend_path.stem.startswith(SKELETAL_PREFIX)
+            or len(bpy.data.armatures) or len(bpy.data.actions)):
+        return _export_skeletal
+    return _export_static
+
+
+def count_ngons(mesh) -> int:
+    """Count faces with more than 4 vertices, reading loop totals in one call."""
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return int(np.count_nonzero(loop_totals > 4))
 
 
 def validate_model(filepath: Path) -> dict:
@@ -99,69 +192,50 @@ def validate_model(filepath: Path) -> dict:
     issues = []
     stats = {"vertices": 0, "faces": 0, "objects": 0, "armatures": 0}
 
-    for obj in bpy.data.objects:
-        if obj.type == "MESH":
-            stats["objects"] += 1
-            mesh = obj.data
-            stats["vertices"] += len(mesh.vertices)
-            stats["faces"] += len(mesh.polygons)
+    buckets = objects_by_type(bpy.data.objects, "MESH", "ARMATURE")
+    meshes = buckets["MESH"]
+
+    # Scale check for every mesh at once
+    scales = np.array([obj.scale[:] for obj in meshes], dtype=np.float32).reshape(-1, 3)
+    bad_scale = np.abs(scales - 1.0).max(axis=1) > 0.001
 
-            # Check for ngons (faces with > 4 vertices)
-            ngons = [p for p in mesh.polygons if len(p.vertices) > 4]
-            if ngons:
-                issues.append(f"{obj.name}: {len(ngons)} ngons found (should be tris/quads)")
+    for obj, scaled in zip(meshes, bad_scale):
+        stats["objects"] += 1
+        mesh = obj.data
+        stats["vertices"] += len(mesh.vertices)
+        stats["faces"] += len(mesh.polygons)
 
-            # Check UV maps
-            if not mesh.uv_layers:
-                issues.append(f"{obj.name}: No UV map")
+        # Check for ngons (faces with > 4 vertices)
+        ngons = count_ngons(mesh)
+        if ngons:
+            issues.append(f"{obj.name}: {ngons} ngons found (should be tris/quads)")
 
-            # Check scale
-            if any(abs(s - 1.0) > 0.001 for s in obj.scale):
-                issues.append(f"{obj.name}: Non-uniform scale {tuple(obj.scale)}")
+        # Check UV maps
+        if not mesh.uv_layers:
+            issues.append(f"{obj.name}: No UV map")
 
-            # Check normals
-            if not mesh.has_custom_normals:
-                pass  # Not always required
+        # Check scale
+        if scaled:
+            issues.append(f"{obj.name}: Non-uniform scale {tuple(obj.scale)}")
 
-        elif obj.type == "ARMATURE":
-            stats["armatures"] += 1
+        # Check normals
+        if not mesh.has_custom_normals:
+            pass  # Not always required
+
+    stats["armatures"] = len(buckets["ARMATURE"])
 
     return {"file": str(filepath), "stats": stats, "issues": issues, "valid": len(issues) == 0}
 
 
-def export_blend_to_fbx(blend_path: Path, export_path: Path) -> bool:
-    """Export a single .blend file to FBX."""
+def export_blend_to_fbx(blend_path: Path, export_path: Path, category: str = "") -> bool:
+    """Export a single .blend file to FBX, picking the preset after opening it."""
     try:
-        clean_scene()
-        bpy.ops.wm.open_mainfile(filepath=str(blend_path))
+        # open_mainfile replaces all of bpy.data, so no scene reset is needed
+        _OPEN_MAINFILE(filepath=str(blend_path))
 
         ensure_dir(export_path.parent)
 
-        bpy.ops.export_scene.fbx(
-            filepath=str(export_path),
-            use_selection=UE5_EXPORT_SETTINGS["use_selection"],
-            global_scale=UE5_EXPORT_SETTINGS["global_scale"],
-            apply_unit_scale=UE5_EXPORT_SETTINGS["apply_unit_scale"],
-            apply_scale_options=UE5_EXPORT_SETTINGS["apply_scale_options"],
-            use_space_transform=UE5_EXPORT_SETTINGS["use_space_transform"],
-            axis_forward=UE5_EXPORT_SETTINGS["axis_forward"],
-            axis_up=UE5_EXPORT_SETTINGS["axis_up"],
-            use_mesh_modifiers=UE5_EXPORT_SETTINGS["use_mesh_modifiers"],
-            mesh_smooth_type=UE5_EXPORT_SETTINGS["mesh_smooth_type"],
-            use_tspace=UE5_EXPORT_SETTINGS["use_tspace"],
-            add_leaf_bones=UE5_EXPORT_SETTINGS["add_leaf_bones"],
-            primary_bone_axis=UE5_EXPORT_SETTINGS["primary_bone_axis"],
-            secondary_bone_axis=UE5_EXPORT_SETTINGS["secondary_bone_axis"],
-            use_armature_deform_only=UE5_EXPORT_SETTINGS["use_armature_deform_only"],
-            bake_anim=UE5_EXPORT_SETTINGS["bake_anim"],
-            bake_anim_use_all_bones=UE5_EXPORT_SETTINGS["bake_anim_use_all_bones"],
-            bake_anim_use_nla_strips=UE5_EXPORT_SETTINGS["bake_anim_use_nla_strips"],
-            bake_anim_use_all_actions=UE5_EXPORT_SETTINGS["bake_anim_use_all_actions"],
-            bake_anim_step=UE5_EXPORT_SETTINGS["bake_anim_step"],
-            bake_anim_simplify_factor=UE5_EXPORT_SETTINGS["bake_anim_simplify_factor"],
-            path_mode=UE5_EXPORT_SETTINGS["path_mode"],
-            embed_textures=UE5_EXPORT_SETTINGS["embed_textures"],
-        )
+        exporter_for(blend_path, category)(str(export_path))
 
         print(f"  [OK] Exported: {blend_path.name} -> {export_path.name}")
         return True
@@ -171,6 +245,16 @@ def export_blend_to_fbx(blend_path: Path, export_path: Path) -> bool:
         return False
 
 
+def run_export_job(workers: WorkerPool, job: dict) -> dict:
+    """Export one file on the next idle Blender worker."""
+    try:
+        ok = bool(workers.call({"op": "export", **job}).get("ok"))
+    except WorkerError as e:
+        print(f"  [FAIL] {Path(job['blend']).name}: {e}")
+        ok = False
+    return {**job, "ok": ok}
+
+
 def main():
     """Main batch export pipeline."""
     print("=" * 60)
@@ -182,58 +266,104 @@ def main():
 
     ensure_dir(EXPORT_DIR)
 
-    # Find all .blend files
-    blend_files = list(MODELS_DIR.rglob("*.blend"))
-
-    if not blend_files:
-        print("No .blend files found in models directory.")
-        print(f"Place your models in: {MODELS_DIR}")
-        return
-
-    print(f"Found {len(blend_files)} .blend files\n")
-
     results = {"exported": 0, "failed": 0, "skipped": 0, "files": []}
-
-    for blend_path in blend_files:
+    total_files = 0
+
+    # Fingerprints keyed by path relative to MODELS_DIR
+    cache = load_export_cache()
+    fingerprints = {}
+
+    # Pass 1: stat every file and settle what timestamps alone can decide
+    candidates = []
+    seen = set()
+    for entry in iter_blends(MODELS_DIR):
+        total_files += 1
+        blend_path = Path(entry.path)
         category = get_category(blend_path)
         fbx_name = blend_path.stem + ".fbx"
         export_path = EXPORT_DIR / category / fbx_name
 
-        # Skip if FBX is newer than .blend
-        if export_path.exists():
-            blend_mtime = blend_path.stat().st_mtime
-            fbx_mtime = export_path.stat().st_mtime
-            if fbx_mtime > blend_mtime:
+        key = blend_path.relative_to(MODELS_DIR).as_posix()
+        seen.add(key)
+        st = entry.stat()
+        fingerprint = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "fbx": str(export_path)}
+        prior = cache.get(key)
+
+        if not (prior and prior.get("fbx") == fingerprint["fbx"] and export_path.exists()):
+            prior = None
+        elif prior["size"] == st.st_size and prior["mtime_ns"] == st.st_mtime_ns:
+            print(f"  [SKIP] {blend_path.name} (up to date)")
+            cache[key] = {**fingerprint, "hash": prior["hash"]}
+            results["skipped"] += 1
+            continue
+
+        candidates.append((blend_path, category, key, fingerprint, prior))
+
+    # Pass 2: hash the rest in parallel; timestamps may disagree with content
+    # (git checkouts, cloud sync), and new exports need a recorded hash
+    digests = digest_files(candidate[0] for candidate in candidates)
+
+    # Pass 3: export what actually changed. Per-file results are appended
+    # to the JSONL log in completion order so a crash keeps progress
+    with WorkerPool(bpy.app.binary_path, EXPORT_WORKERS) as workers, \
+            ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as pool, \
+            open(REPORT_PATH.with_suffix(".jsonl"), "ab") as log:
+        futures = []
+
+        for blend_path, category, key, fingerprint, prior in candidates:
+            fingerprint["hash"] = digests[blend_path]
+
+            if prior and prior["hash"] == fingerprint["hash"]:
                 print(f"  [SKIP] {blend_path.name} (up to date)")
+                cache[key] = fingerprint
                 results["skipped"] += 1
                 continue
 
-        print(f"Exporting: {blend_path.name} [{category}]")
+            fingerprints[str(blend_path)] = (key, fingerprint)
+
+            print(f"Exporting: {blend_path.name} [{category}]")
+            job = {"blend": str(blend_path), "fbx": fingerprint["fbx"], "category": category}
+            futures.append(pool.submit(run_export_job, workers, job))
+
+        for future in as_completed(futures):
+            result = future.result()
+            log.write(dump_json({**result, "timestamp": datetime.now().isoformat()}, indent=False) + b"\n")
+            log.flush()
+
+            key, fingerprint = fingerprints[result["blend"]]
+            if result["ok"]:
+                results["exported"] += 1
+                results["files"].append(result["fbx"])
+                cache[key] = fingerprint
+            else:
+                results["failed"] += 1
+                cache.pop(key, None)
+
+    if not total_files:
+        print("No .blend files found in models directory.")
+        print(f"Place your models in: {MODELS_DIR}")
+        return
 
-        if export_blend_to_fbx(blend_path, export_path):
-            results["exported"] += 1
-            results["files"].append(str(export_path))
-        else:
-            results["failed"] += 1
+    # Forget .blend files that were deleted or renamed since the last run
+    save_export_cache({key: entry for key, entry in cache.items() if key in seen})
 
     # Write export report
-    report_path = EXPORT_DIR / "export_report.json"
     report = {
         "timestamp": datetime.now().isoformat(),
-        "total_files": len(blend_files),
+        "total_files": total_files,
         "exported": results["exported"],
         "failed": results["failed"],
         "skipped": results["skipped"],
         "files": results["files"],
     }
 
-    with open(report_path, "w") as f:
-        json.dump(report, f, indent=2)
+    with open(REPORT_PATH, "wb") as f:
+        f.write(dump_json(report))
 
     print("\n" + "=" * 60)
-    print(f"Export complete: {results['exported']} exported, "
+    print(f"Export complete: {total_files} files, {results['exported']} exported, "
           f"{results['skipped']} skipped, {results['failed']} failed")
-    print(f"Report: {report_path}")
+    print(f"Report: {REPORT_PATH}")
     print("=" * 60)
 
 
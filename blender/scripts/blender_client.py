@@ -0,0 +1,164 @@
+"""
+Tower Game - Blender Worker Client
+Spawns long-lived headless Blender sessions running blender_worker.py and
+sends them commands, so a batch pays Blender's startup cost once per worker
+instead of once per file.
+
+Protocol: one JSON command per line on the worker's stdin, one JSON reply
+per line on its stdout, prefixed with REPLY_MARKER. The worker moves all
+other output (Blender's own and the FBX exporter's) to stderr, so stdout
+only carries replies; stray lines are still forwarded as log.
+
+  {"op": "export", "blend": "...", "fbx": "...", "category": "..."}  -> {"ok": true}
+  {"op": "validate", "blend": "..."}  -> {"ok": true, "report": {...}}
+  {"op": "quit"}
+
+Does not import bpy, so it can drive workers from outside Blender (e.g. CI).
+"""
+
+import sys
+import json
+import time
+import queue
+import threading
+import subprocess
+from pathlib import Path
+
+
+WORKER_SCRIPT = Path(__file__).resolve().parent / "blender_worker.py"
+REPLY_MARKER = "TOWER_WORKER_REPLY "
+
+# Seconds a single command may take before the worker is considered hung
+DEFAULT_TIMEOUT = 900.0
+
+
+class WorkerError(RuntimeError):
+    """A worker crashed, hung, or could not be talked to."""
+
+
+class BlenderWorker:
+    """One headless Blender process serving commands over stdin/stdout."""
+
+    def __init__(self, blender_binary: str, timeout: float = DEFAULT_TIMEOUT):
+        self.blender_binary = blender_binary
+        self.timeout = timeout
+        self.proc = None
+        self._lines = None
+
+    def start(self):
+        self.proc = subprocess.Popen(
+            [self.blender_binary, "--background", "--factory-startup",
+             "--python", str(WORKER_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+        )
+
+        # Reading on a thread lets call() give up on a hung worker
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._pump, args=(self.proc.stdout, self._lines), daemon=True
+        ).start()
+
+    @staticmethod
+    def _pump(stream, lines: queue.Queue):
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def _kill(self):
+        self.proc.kill()
+        self.proc.wait()
+        self.proc = None
+
+    def call(self, command: dict) -> dict:
+        """Send a command and wait for its reply, (re)starting Blender if needed.
+
+        Raises WorkerError if the worker dies, hangs past the timeout or
+        sends an unreadable reply; the next call starts a fresh worker.
+        """
+        if self.proc is None or self.proc.poll() is not None:
+            self.start()
+
+        try:
+            self.proc.stdin.write(json.dumps(command) + "\n")
+            self.proc.stdin.flush()
+        except OSError as e:
+            self._kill()
+            raise WorkerError(f"Blender worker not accepting commands: {e}") from e
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self._kill()
+                raise WorkerError(f"Blender worker timed out after {self.timeout:.0f}s") from None
+
+            # stdout closed before a reply: Blender crashed on this command
+            if line is None:
+                code = self.proc.wait()
+                self.proc = None
+                raise WorkerError(f"Blender worker exited with code {code}")
+
+            # The marker may follow an unterminated line flushed ahead of it
+            pos = line.find(REPLY_MARKER)
+            if pos < 0:
+                sys.stdout.write(line)
+                continue
+            if pos > 0:
+                sys.stdout.write(line[:pos] + "\n")
+
+            try:
+                return json.loads(line[pos + len(REPLY_MARKER):])
+            except ValueError as e:
+                self._kill()
+                raise WorkerError(f"Unreadable reply from Blender worker: {e}") from e
+
+    def close(self):
+        if self.proc is not None and self.proc.poll() is None:
+            try:
+                self.proc.stdin.write(json.dumps({"op": "quit"}) + "\n")
+                self.proc.stdin.close()
+            except OSError:
+                pass
+            try:
+                self.proc.wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        self.proc = None
+
+
+class WorkerPool:
+    """Fixed set of Blender workers shared between calling threads.
+
+    Workers start lazily on their first command; call() blocks until one
+    is idle.
+    """
+
+    def __init__(self, blender_binary: str, size: int, timeout: float = DEFAULT_TIMEOUT):
+        self.workers = [BlenderWorker(blender_binary, timeout) for _ in range(size)]
+        self._idle = queue.Queue()
+        for worker in self.workers:
+            self._idle.put(worker)
+
+    def call(self, command: dict) -> dict:
+        worker = self._idle.get()
+        try:
+            return worker.call(command)
+        finally:
+            self._idle.put(worker)
+
+    def close(self):
+        for worker in self.workers:
+            worker.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,76 @@
+"""
+Tower Game - Persistent Blender Worker
+Serves export and validation commands from blender_client.py inside a
+single Blender session. See blender_client.py for the protocol.
+
+Usage (normally spawned by blender_client.WorkerPool):
+  blender --background --factory-startup --python blender/scripts/blender_worker.py
+"""
+
+import os
+import sys
+import json
+from pathlib import Path
+
+# Blender does not put the script directory on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from blender_client import REPLY_MARKER  # noqa: E402
+from validate_models import ModelValidator  # noqa: E402
+
+
+def handle(command: dict, validator: ModelValidator) -> dict:
+    """Run one command and build its reply."""
+    op = command.get("op")
+
+    if op == "export":
+        # Imported on first use: batch_export builds the FBX exporters at
+        # import time, which validation-only workers never need
+        from batch_export import export_blend_to_fbx
+
+        ok = export_blend_to_fbx(
+            Path(command["blend"]), Path(command["fbx"]),
+            command.get("category", ""),
+        )
+        return {"ok": ok}
+
+    if op == "validate":
+        return {"ok": True, "report": validator.check_file(Path(command["blend"]))}
+
+    return {"ok": False, "error": f"Unknown op: {op}"}
+
+
+def open_reply_channel():
+    """Keep the original stdout for replies and point fd 1 at stderr.
+
+    Blender's C code buffers its stdout separately from Python, so a
+    partial line could otherwise land in front of a reply.
+    """
+    sys.stdout.flush()
+    reply_fd = os.dup(1)
+    os.dup2(2, 1)
+    return os.fdopen(reply_fd, "w", encoding="utf-8", buffering=1)
+
+
+def main():
+    replies = open_reply_channel()
+    validator = ModelValidator()
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        command = json.loads(line)
+        if command.get("op") == "quit":
+            break
+
+        try:
+            reply = handle(command, validator)
+        except Exception as e:
+            reply = {"ok": False, "error": str(e)}
+
+        print(REPLY_MARKER + json.dumps(reply), file=replies, flush=True)
+
+
+if __name__ == "__main__":
+    main()
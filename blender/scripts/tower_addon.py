@@ -17,6 +17,7 @@ bl_info = {
 
 import bpy
 from bpy.props import EnumProperty, FloatProperty, StringProperty
+import numpy as np
 import os
 from pathlib import Path
 
@@ -55,6 +56,9 @@ MONSTER_PARTS = [
 PLAYER_HEIGHT_CM = 180.0
 SCALE_FACTOR = 0.01  # Blender meters -> UE5 centimeters
 
+# Per-mesh vertex budget before LODs are recommended
+MAX_MESH_VERTICES = 50000
+
 
 class TOWER_PT_MainPanel(bpy.types.Panel):
     bl_label = "Tower Game"
@@ -122,23 +126,32 @@ class TOWER_OT_ValidateAsset(bpy.types.Operator):
     def execute(self, context):
         issues = []
 
-        for obj in context.scene.objects:
-            if obj.name.startswith("REF_"):
-                continue
+        # Linked meshes whose library is missing have no data
+        meshes = [
+            obj for obj in context.scene.objects
+            if obj.type == "MESH" and obj.data is not None and not obj.name.startswith("REF_")
+        ]
+
+        # Scale and vertex budget for all meshes at once
+        scales = np.array([obj.scale[:] for obj in meshes], dtype=np.float32).reshape(-1, 3)
+        bad_scale = np.abs(scales - 1.0).max(axis=1) > 0.001
+        vert_counts = np.fromiter(
+            (len(obj.data.vertices) for obj in meshes), dtype=np.int64, count=len(meshes)
+        )
+        too_dense = vert_counts > MAX_MESH_VERTICES
 
-            if obj.type == "MESH":
-                # Check scale
-                if any(abs(s - 1.0) > 0.001 for s in obj.scale):
-                    issues.append(f"{obj.name}: Unapplied scale")
+        for obj, scaled, dense, verts in zip(meshes, bad_scale, too_dense, vert_counts):
+            # Check scale
+            if scaled:
+                issues.append(f"{obj.name}: Unapplied scale")
 
-                # Check UVs
-                if not obj.data.uv_layers:
-                    issues.append(f"{obj.name}: No UV map")
+            # Check UVs
+            if not obj.data.uv_layers:
+                issues.append(f"{obj.name}: No UV map")
 
-                # Check vertex count
-                verts = len(obj.data.vertices)
-                if verts > 50000:
-                    issues.append(f"{obj.name}: {verts} vertices (consider LODs)")
+            # Check vertex count
+            if dense:
+                issues.append(f"{obj.name}: {verts} vertices (consider LODs)")
 
         if issues:
             for issue in issues:
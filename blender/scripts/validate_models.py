@@ -5,20 +5,50 @@ Checks all .blend models for UE5 compatibility.
 Validates: scale, normals, UVs, polygon count, naming conventions,
 material setup, and armature structure.
 
+Files are validated in parallel by a pool of persistent headless Blender
+workers (see blender_client.py).
+
+Unchanged files reuse their previous result as long as the validation
+rules are unchanged too; pass --no-cache to re-validate everything.
+
 Usage:
   blender --background --python blender/scripts/validate_models.py
+  blender --background --python blender/scripts/validate_models.py -- --no-cache
 """
 
 import bpy
+import numpy as np
 import os
+import sys
 import json
+import hashlib
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import msgspec
+except ImportError:  # Not bundled with Blender; fall back to dump_json
+    msgspec = None
+
+try:
+    import zstandard as zstd
+except ImportError:  # Not bundled with Blender; old reports stay uncompressed
+    zstd = None
+
+# Blender does not put the script directory on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import asset_utils  # noqa: E402
+from asset_utils import digest_files, dump_json, iter_blends, objects_by_type  # noqa: E402
+from blender_client import WorkerError, WorkerPool  # noqa: E402
+
 
 SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 MODELS_DIR = SCRIPT_DIR.parent / "models"
 REPORT_DIR = SCRIPT_DIR.parent / "reports"
+HASHES_PATH = REPORT_DIR / "hashes.json"
 
 # UE5 compatibility limits
 MAX_VERTICES_LOD0 = 100000
@@ -26,37 +56,186 @@ MAX_BONES = 256
 EXPECTED_SCALE = (1.0, 1.0, 1.0)
 SCALE_TOLERANCE = 0.001
 
+try:
+    _OPEN_MAINFILE = bpy.ops.wm.open_mainfile
+except AttributeError:  # bpy stub without operators (docs builds, linters)
+    _OPEN_MAINFILE = None
+
+# Number of persistent headless Blender processes used for validation
+VALIDATE_WORKERS = os.cpu_count() or 1
+
+
+def empty_report(filepath: Path) -> dict:
+    """Report skeleton for a single .blend file."""
+    return {
+        "file": filepath.name,
+        "path": str(filepath),
+        "objects": [],
+        "issues": [],
+        "warnings": [],
+        "stats": {
+            "total_vertices": 0,
+            "total_faces": 0,
+            "mesh_objects": 0,
+            "armatures": 0,
+            "materials": 0,
+        },
+    }
+
+
+def _validate_one(workers: WorkerPool, path_str: str) -> dict:
+    """Validate one file on the next idle Blender worker."""
+    try:
+        reply = workers.call({"op": "validate", "blend": path_str})
+    except WorkerError as e:
+        reply = {"ok": False, "error": str(e)}
+
+    if reply["ok"]:
+        return reply["report"]
+
+    report = empty_report(Path(path_str))
+    report["issues"].append(f"Validation failed: {reply['error']}")
+    report["valid"] = False
+    report["worker_error"] = True
+    return report
+
+
+def validator_fingerprint() -> str:
+    """Digest of everything the validation results depend on.
+
+    Covers this script, the shared helpers it validates with, the limit
+    constants and the Blender version. Cached results are only reused
+    while all of these are unchanged.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for module in (__file__, asset_utils.__file__):
+        with open(os.path.abspath(module), "rb") as f:
+            hasher.update(f.read())
+    limits = (MAX_VERTICES_LOD0, MAX_BONES, EXPECTED_SCALE, SCALE_TOLERANCE)
+    hasher.update(repr(limits).encode("utf-8"))
+    hasher.update(bpy.app.version_string.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def load_prior_results(fingerprint: str) -> tuple:
+    """Per-file reports of the latest run and the content hashes they were made from.
+
+    Returns nothing to reuse when the previous run used different rules.
+    """
+    try:
+        with open(HASHES_PATH) as f:
+            cache = json.load(f)
+        hashes = cache["files"] if cache["validator"] == fingerprint else {}
+    except (OSError, ValueError, KeyError, TypeError):
+        hashes = {}
+
+    prior = {}
+    reports = sorted(REPORT_DIR.glob("validation_*.json"))
+    if hashes and reports:
+        try:
+            with open(reports[-1]) as f:
+                prior = {r["path"]: r for r in json.load(f)["files"]}
+        except (OSError, ValueError, KeyError):
+            prior = {}
+
+    return prior, hashes
+
+
+def save_hashes(fingerprint: str, hashes: dict):
+    """Write the validation cache atomically so an interrupted run can't corrupt it."""
+    tmp_path = HASHES_PATH.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(dump_json({"validator": fingerprint, "files": hashes}))
+    os.replace(tmp_path, HASHES_PATH)
+
+
+def parse_args():
+    """Parse script arguments given after Blender's own, behind '--'."""
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="validate_models.py")
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="re-validate every file, ignoring results from the previous run",
+    )
+    return parser.parse_args(argv)
+
+
+def encode_report(summary: dict) -> bytes:
+    """Serialize a validation report as compact JSON, using msgspec when it is installed."""
+    if msgspec is not None:
+        return msgspec.json.encode(summary)
+    return dump_json(summary, indent=False)
+
+
+def compress_old_reports(latest: Path):
+    """Archive every validation report except the latest as .json.zst."""
+    if zstd is None:
+        return
+
+    compressor = zstd.ZstdCompressor(level=3)
+    for path in REPORT_DIR.glob("validation_*.json"):
+        if path == latest:
+            continue
+        with open(path, "rb") as src, open(path.with_suffix(".json.zst"), "wb") as dst:
+            compressor.copy_stream(src, dst)
+        path.unlink()
+
+
+def print_result(result: dict):
+    """Print one file's outcome to the console."""
+    print(f"Validating: {result['file']}")
+    cached = " (cached)" if result.get("cached") else ""
+
+    if result["valid"]:
+        print(f"  [PASS]{cached} {result['stats']['total_vertices']} verts, "
+              f"{result['stats']['total_faces']} faces")
+    else:
+        print(f"  [FAIL]{cached} {len(result['issues'])} issues:")
+        for issue in result["issues"]:
+            print(f"    - {issue}")
+
+    if result["warnings"]:
+        for warn in result["warnings"]:
+            print(f"    [WARN] {warn}")
+
+    print()
+
 
 class ModelValidator:
     def __init__(self):
         self.results = []
         self.total_issues = 0
 
+        # foreach_get scratch buffers, grown on demand and reused across meshes
+        self._loop_totals = np.empty(0, np.int32)
+        self._edge_buf = np.empty(0, np.int32)
+
     def validate_file(self, filepath: Path) -> dict:
-        """Validate a single .blend file."""
-        bpy.ops.wm.read_homefile(use_empty=True)
-        bpy.ops.wm.open_mainfile(filepath=str(filepath))
-
-        report = {
-            "file": filepath.name,
-            "path": str(filepath),
-            "objects": [],
-            "issues": [],
-            "warnings": [],
-            "stats": {
-                "total_vertices": 0,
-                "total_faces": 0,
-                "mesh_objects": 0,
-                "armatures": 0,
-                "materials": 0,
-            },
-        }
+        """Validate a single .blend file and record the result."""
+        report = self.check_file(filepath)
+        self.add_result(report)
+        return report
+
+    def check_file(self, filepath: Path) -> dict:
+        """Validate a single .blend file without recording the result."""
+        _OPEN_MAINFILE(filepath=str(filepath))
+
+        report = empty_report(filepath)
+
+        buckets = objects_by_type(bpy.data.objects, "MESH", "ARMATURE")
+        meshes = buckets["MESH"]
 
-        for obj in bpy.data.objects:
-            if obj.type == "MESH":
-                self._validate_mesh(obj, report)
-            elif obj.type == "ARMATURE":
-                self._validate_armature(obj, report)
+        # Transform checks for every mesh at once
+        scales = np.array([obj.scale[:] for obj in meshes], dtype=np.float32).reshape(-1, 3)
+        rotations = np.array([obj.rotation_euler[:] for obj in meshes], dtype=np.float32).reshape(-1, 3)
+        bad_scale_axes = np.abs(scales - EXPECTED_SCALE) > SCALE_TOLERANCE
+        rotated = (np.abs(rotations) > 0.001).any(axis=1)
+
+        for obj, bad_axes, has_rotation in zip(meshes, bad_scale_axes, rotated):
+            self._validate_mesh(obj, report, bad_axes, has_rotation)
+
+        for obj in buckets["ARMATURE"]:
+            self._validate_armature(obj, report)
 
         # Validate materials
         for mat in bpy.data.materials:
@@ -72,12 +251,19 @@ class ModelValidator:
             )
 
         report["valid"] = len(report["issues"]) == 0
+        return report
+
+    def add_result(self, report: dict):
+        """Record a file report, whether validated here or in a worker."""
         self.total_issues += len(report["issues"])
         self.results.append(report)
-        return report
 
-    def _validate_mesh(self, obj, report: dict):
-        """Validate a mesh object."""
+    def _validate_mesh(self, obj, report: dict, bad_scale_axes, has_rotation: bool):
+        """Validate a mesh object.
+
+        Scale and rotation are checked for all meshes in check_file;
+        bad_scale_axes and has_rotation carry the results for this object.
+        """
         mesh = obj.data
         info = {
             "name": obj.name,
@@ -92,16 +278,15 @@ class ModelValidator:
         report["objects"].append(info)
 
         # Check applied scale
-        for i, (s, expected) in enumerate(zip(obj.scale, EXPECTED_SCALE)):
-            if abs(s - expected) > SCALE_TOLERANCE:
-                axis = "XYZ"[i]
-                report["issues"].append(
-                    f"'{obj.name}': Scale {axis}={s:.3f} (expected {expected}). "
-                    f"Apply scale with Ctrl+A"
-                )
+        for i in np.flatnonzero(bad_scale_axes):
+            axis = "XYZ"[i]
+            report["issues"].append(
+                f"'{obj.name}': Scale {axis}={obj.scale[i]:.3f} (expected {EXPECTED_SCALE[i]}). "
+                f"Apply scale with Ctrl+A"
+            )
 
         # Check applied rotation
-        if any(abs(r) > 0.001 for r in obj.rotation_euler):
+        if has_rotation:
             report["warnings"].append(
                 f"'{obj.name}': Has unapplied rotation. Consider Ctrl+A -> Rotation"
             )
@@ -115,17 +300,18 @@ class ModelValidator:
             )
 
         # Check ngons
-        ngons = sum(1 for p in mesh.polygons if len(p.vertices) > 4)
+        loop_totals = self._scratch("_loop_totals", len(mesh.polygons))
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        ngons = int(np.count_nonzero(loop_totals > 4))
         if ngons > 0:
             report["warnings"].append(
                 f"'{obj.name}': {ngons} ngons (triangulate for best UE5 results)"
             )
 
         # Check loose vertices
-        vertex_used = set()
-        for edge in mesh.edges:
-            vertex_used.update(edge.vertices)
-        loose = len(mesh.vertices) - len(vertex_used)
+        edge_verts = self._scratch("_edge_buf", len(mesh.edges) * 2)
+        mesh.edges.foreach_get("vertices", edge_verts)
+        loose = len(mesh.vertices) - np.unique(edge_verts).size
         if loose > 0:
             report["warnings"].append(f"'{obj.name}': {loose} loose vertices")
 
@@ -135,6 +321,14 @@ class ModelValidator:
                 f"'{obj.name}': Consider UE5 naming: SM_ (static), SK_ (skeletal)"
             )
 
+    def _scratch(self, attr: str, size: int) -> np.ndarray:
+        """View of the named int32 scratch buffer, grown to fit size items."""
+        buf = getattr(self, attr)
+        if buf.size < size:
+            buf = np.empty(size * 2, np.int32)
+            setattr(self, attr, buf)
+        return buf[:size]
+
     def _validate_armature(self, obj, report: dict):
         """Validate an armature object."""
         armature = obj.data
@@ -171,48 +365,59 @@ class ModelValidator:
             "files": self.results,
         }
 
-        with open(report_path, "w") as f:
-            json.dump(summary, f, indent=2)
+        with open(report_path, "wb") as f:
+            f.write(encode_report(summary))
+
+        # The latest report stays plain JSON: it seeds the next run's cache
+        compress_old_reports(report_path)
 
         return str(report_path)
 
 
 def main():
+    args = parse_args()
+
     print("=" * 60)
     print("Tower Game - Model Validator")
     print(f"Models dir: {MODELS_DIR}")
     print("=" * 60)
 
-    blend_files = list(MODELS_DIR.rglob("*.blend"))
+    validator = ModelValidator()
+    fingerprint = validator_fingerprint()
+    prior, prior_hashes = ({}, {}) if args.no_cache else load_prior_results(fingerprint)
+    hashes = {}
 
-    if not blend_files:
-        print("No .blend files found.")
-        print(f"Place models in: {MODELS_DIR}")
-        return
+    # Hash everything up front in parallel, then hand only changed files to Blender
+    digests = digest_files(entry.path for entry in iter_blends(MODELS_DIR))
 
-    print(f"Found {len(blend_files)} models to validate\n")
+    with WorkerPool(bpy.app.binary_path, VALIDATE_WORKERS) as workers, \
+            ThreadPoolExecutor(max_workers=VALIDATE_WORKERS) as pool:
+        jobs = []
 
-    validator = ModelValidator()
+        # Validation has no side effects, so an unchanged file reuses its last report
+        for path, digest in digests.items():
+            if prior_hashes.get(path) == digest and path in prior:
+                jobs.append((path, digest, {**prior[path], "cached": True}))
+            else:
+                jobs.append((path, digest, pool.submit(_validate_one, workers, path)))
 
-    for filepath in blend_files:
-        print(f"Validating: {filepath.name}")
-        result = validator.validate_file(filepath)
+        for path, digest, job in jobs:
+            result = job if isinstance(job, dict) else job.result()
+            validator.add_result(result)
 
-        if result["valid"]:
-            print(f"  [PASS] {result['stats']['total_vertices']} verts, "
-                  f"{result['stats']['total_faces']} faces")
-        else:
-            print(f"  [FAIL] {len(result['issues'])} issues:")
-            for issue in result["issues"]:
-                print(f"    - {issue}")
+            # A crashed worker says nothing about the file; retry it next run
+            if not result.get("worker_error"):
+                hashes[path] = digest
 
-        if result["warnings"]:
-            for warn in result["warnings"]:
-                print(f"    [WARN] {warn}")
+            print_result(result)
 
-        print()
+    if not validator.results:
+        print("No .blend files found.")
+        print(f"Place models in: {MODELS_DIR}")
+        return
 
     report_path = validator.generate_report()
+    save_hashes(fingerprint, hashes)
 
     print("=" * 60)
     valid = sum(1 for r in validator.results if r["valid"])
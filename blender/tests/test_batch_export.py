@@ -0,0 +1,213 @@
+"""
+Tests for blender/scripts/batch_export.py helpers that don't need Blender.
+
+Run: python -m pytest blender/tests
+"""
+
+import json
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+# batch_export imports bpy at module level; operator lookups are guarded, so
+# an empty module is enough to import the pure-Python helpers
+sys.modules.setdefault("bpy", types.ModuleType("bpy"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import batch_export  # noqa: E402
+from batch_export import ASSET_CATEGORIES, exporter_for, get_category  # noqa: E402
+
+
+def baseline_get_category(filepath: Path) -> str:
+    """The original ordered substring loop that get_category must match."""
+    name_lower = filepath.stem.lower()
+    parent_lower = filepath.parent.name.lower()
+
+    for key, category in ASSET_CATEGORIES.items():
+        if key in name_lower or key in parent_lower:
+            return category
+
+    return "Misc"
+
+
+CATEGORY_PATHS = [
+    "characters/SK_knight_suit.blend",
+    "characters/SK_guide_npc.blend",
+    "characters/SK_hero_armor.blend",
+    "monsters/SK_goblin_build.blend",
+    "monsters/SK_fruit_slime.blend",
+    "weapons/SM_sword.blend",
+    "weapons/SM_armor_rack.blend",
+    "armor/SM_chest_plate.blend",
+    "environment/SM_props_crate.blend",
+    "props/SM_barrel.blend",
+    "vfx/S_fire.blend",
+    "ui/SM_icon_frame.blend",
+    "misc/SM_rock.blend",
+    "SM_characters_ui_weapons.blend",
+    "SM_props_vfx.blend",
+    "SM_untitled.blend",
+    "Characters/SK_Hero.blend",
+]
+
+
+@pytest.mark.parametrize("rel_path", CATEGORY_PATHS)
+def test_get_category_matches_baseline(rel_path):
+    path = Path("/models") / rel_path
+    assert get_category(path) == baseline_get_category(path)
+
+
+def test_get_category_keeps_characters_with_ui_substring():
+    assert get_category(Path("/models/characters/SK_guide_npc.blend")) == "Characters"
+    assert get_category(Path("/models/monsters/SK_goblin_build.blend")) == "Monsters"
+
+
+@pytest.mark.parametrize("name, category, armatures, actions, skeletal", [
+    ("SK_Hero", "Characters", 0, 0, True),
+    ("SM_Crate", "Props", 0, 0, False),
+    ("SK_Banner", "Misc", 0, 0, True),
+    ("SM_Rigged_Door", "Environment", 1, 0, True),
+    ("SM_Spinning_Fan", "Props", 0, 1, True),
+])
+def test_exporter_for_keeps_rigged_files_skeletal(monkeypatch, name, category, armatures, actions, skeletal):
+    data = types.SimpleNamespace(armatures=[object()] * armatures, actions=[object()] * actions)
+    monkeypatch.setattr(batch_export.bpy, "data", data, raising=False)
+
+    exporter = exporter_for(Path(f"/models/{name}.blend"), category)
+    assert (exporter is batch_export._export_skeletal) == skeletal
+
+
+class FakeWorkerPool:
+    """Stands in for blender_client.WorkerPool; 'exports' by writing the FBX."""
+
+    calls = []
+    failing = set()
+
+    def __init__(self, blender_binary, size, timeout=None):
+        pass
+
+    def call(self, command):
+        FakeWorkerPool.calls.append(Path(command["blend"]).name)
+        if Path(command["blend"]).name in FakeWorkerPool.failing:
+            return {"ok": False}
+        Path(command["fbx"]).parent.mkdir(parents=True, exist_ok=True)
+        Path(command["fbx"]).write_bytes(b"fbx")
+        return {"ok": True}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+@pytest.fixture
+def export_env(tmp_path, monkeypatch):
+    models, export = tmp_path / "models", tmp_path / "export"
+    models.mkdir()
+    monkeypatch.setattr(batch_export, "MODELS_DIR", models)
+    monkeypatch.setattr(batch_export, "EXPORT_DIR", export)
+    monkeypatch.setattr(batch_export, "EXPORT_CACHE_PATH", export / ".export_cache.json")
+    monkeypatch.setattr(batch_export, "REPORT_PATH", export / "export_report.json")
+    monkeypatch.setattr(batch_export, "WorkerPool", FakeWorkerPool)
+    monkeypatch.setattr(batch_export.bpy, "app", types.SimpleNamespace(binary_path="blender"), raising=False)
+    monkeypatch.setattr(FakeWorkerPool, "calls", [])
+    monkeypatch.setattr(FakeWorkerPool, "failing", set())
+
+    hashed = []
+    digest_files = batch_export.digest_files
+
+    def recording_digest_files(paths):
+        paths = list(paths)
+        hashed.extend(Path(p).name for p in paths)
+        return digest_files(paths)
+
+    monkeypatch.setattr(batch_export, "digest_files", recording_digest_files)
+    return types.SimpleNamespace(models=models, export=export, hashed=hashed)
+
+
+def add_blend(env, rel_path: str, content: bytes = b"blend") -> Path:
+    path = env.models / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def run_export(env) -> dict:
+    FakeWorkerPool.calls.clear()
+    env.hashed.clear()
+    batch_export.main()
+    return json.loads((env.export / ".export_cache.json").read_text())
+
+
+def test_export_cache_skips_matching_size_and_mtime_without_hashing(export_env):
+    add_blend(export_env, "props/SM_crate.blend")
+    run_export(export_env)
+    assert FakeWorkerPool.calls == ["SM_crate.blend"]
+
+    run_export(export_env)
+    assert FakeWorkerPool.calls == []
+    assert export_env.hashed == []
+
+
+def test_export_cache_refreshes_fingerprint_when_only_mtime_changes(export_env):
+    path = add_blend(export_env, "props/SM_crate.blend")
+    run_export(export_env)
+
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 10**9))
+    cache = run_export(export_env)
+    assert export_env.hashed == ["SM_crate.blend"]
+    assert FakeWorkerPool.calls == []
+    assert cache["props/SM_crate.blend"]["mtime_ns"] == path.stat().st_mtime_ns
+
+
+def test_export_cache_reexports_changed_content(export_env):
+    path = add_blend(export_env, "props/SM_crate.blend")
+    old_hash = run_export(export_env)["props/SM_crate.blend"]["hash"]
+
+    path.write_bytes(b"edited blend")
+    cache = run_export(export_env)
+    assert FakeWorkerPool.calls == ["SM_crate.blend"]
+    assert cache["props/SM_crate.blend"]["hash"] != old_hash
+
+
+def test_export_cache_reexports_missing_fbx(export_env):
+    add_blend(export_env, "props/SM_crate.blend")
+    run_export(export_env)
+
+    (export_env.export / "Props" / "SM_crate.fbx").unlink()
+    run_export(export_env)
+    assert FakeWorkerPool.calls == ["SM_crate.blend"]
+
+
+def test_export_cache_reexports_when_category_changes(export_env, monkeypatch):
+    add_blend(export_env, "props/SM_crate.blend")
+    run_export(export_env)
+
+    monkeypatch.setattr(batch_export, "get_category", lambda path: "Environment")
+    cache = run_export(export_env)
+    assert FakeWorkerPool.calls == ["SM_crate.blend"]
+    assert cache["props/SM_crate.blend"]["fbx"] == str(export_env.export / "Environment" / "SM_crate.fbx")
+
+
+def test_export_cache_evicts_failed_export(export_env):
+    path = add_blend(export_env, "props/SM_crate.blend")
+    run_export(export_env)
+
+    path.write_bytes(b"broken blend")
+    FakeWorkerPool.failing.add("SM_crate.blend")
+    assert "props/SM_crate.blend" not in run_export(export_env)
+
+
+def test_export_cache_prunes_deleted_files(export_env):
+    add_blend(export_env, "props/SM_crate.blend")
+    gone = add_blend(export_env, "props/SM_barrel.blend")
+    run_export(export_env)
+
+    gone.unlink()
+    assert list(run_export(export_env)) == ["props/SM_crate.blend"]
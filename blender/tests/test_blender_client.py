@@ -0,0 +1,80 @@
+"""
+Tests for blender/scripts/blender_client.py against a fake Blender binary.
+
+Run: python -m pytest blender/tests
+"""
+
+import os
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from blender_client import REPLY_MARKER, BlenderWorker, WorkerError  # noqa: E402
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake binary relies on a shebang")
+
+
+def fake_blender(tmp_path: Path, body: str) -> str:
+    """Write an executable that stands in for Blender running blender_worker.py."""
+    path = tmp_path / "blender"
+    path.write_text(
+        f"#!{sys.executable}\n"
+        "import json, sys, time\n"
+        f"MARKER = {REPLY_MARKER!r}\n"
+        "for line in sys.stdin:\n"
+        "    command = json.loads(line)\n"
+        "    if command['op'] == 'quit':\n"
+        "        break\n"
+        + textwrap.indent(textwrap.dedent(body), "    ")
+    )
+    path.chmod(0o755)
+    return str(path)
+
+
+def test_call_returns_reply(tmp_path):
+    binary = fake_blender(tmp_path, """
+        print('Read blend: x.blend')
+        print(MARKER + json.dumps({'ok': True, 'op': command['op']}), flush=True)
+    """)
+    worker = BlenderWorker(binary, timeout=10)
+    try:
+        assert worker.call({"op": "export"}) == {"ok": True, "op": "export"}
+        assert worker.call({"op": "validate"}) == {"ok": True, "op": "validate"}
+    finally:
+        worker.close()
+
+
+def test_reply_after_unterminated_line_is_found(tmp_path):
+    binary = fake_blender(tmp_path, """
+        sys.stdout.write('partial C output')
+        print(MARKER + json.dumps({'ok': True}), flush=True)
+    """)
+    worker = BlenderWorker(binary, timeout=10)
+    try:
+        assert worker.call({"op": "export"}) == {"ok": True}
+    finally:
+        worker.close()
+
+
+def test_hung_worker_times_out(tmp_path):
+    binary = fake_blender(tmp_path, "time.sleep(60)\n")
+    worker = BlenderWorker(binary, timeout=0.5)
+    with pytest.raises(WorkerError, match="timed out"):
+        worker.call({"op": "export"})
+    assert worker.proc is None
+
+
+def test_crash_and_bad_reply_raise_worker_error(tmp_path):
+    binary = fake_blender(tmp_path, "sys.exit(3)\n")
+    worker = BlenderWorker(binary, timeout=10)
+    with pytest.raises(WorkerError, match="code 3"):
+        worker.call({"op": "export"})
+
+    binary = fake_blender(tmp_path, "print(MARKER + '{not json', flush=True)\n")
+    worker = BlenderWorker(binary, timeout=10)
+    with pytest.raises(WorkerError, match="Unreadable"):
+        worker.call({"op": "export"})
@@ -0,0 +1,71 @@
+"""
+Tests for the validation cache in blender/scripts/validate_models.py.
+
+Run: python -m pytest blender/tests
+"""
+
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+sys.modules.setdefault("bpy", types.ModuleType("bpy"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import validate_models  # noqa: E402
+from validate_models import load_prior_results, save_hashes, validator_fingerprint  # noqa: E402
+
+
+@pytest.fixture
+def report_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(validate_models, "REPORT_DIR", tmp_path)
+    monkeypatch.setattr(validate_models, "HASHES_PATH", tmp_path / "hashes.json")
+    monkeypatch.setattr(validate_models.bpy, "app", types.SimpleNamespace(version_string="4.2.0"), raising=False)
+    report = {"files": [{"path": "/models/SM_Crate.blend", "issues": []}]}
+    (tmp_path / "validation_20260101_000000.json").write_text(json.dumps(report))
+    return tmp_path
+
+
+def write_hashes(report_dir: Path, cache):
+    (report_dir / "hashes.json").write_text(json.dumps(cache))
+
+
+def test_prior_results_reused_with_same_fingerprint(report_dir):
+    fingerprint = validator_fingerprint()
+    write_hashes(report_dir, {"validator": fingerprint, "files": {"/models/SM_Crate.blend": "xxh64:1"}})
+
+    prior, hashes = load_prior_results(fingerprint)
+    assert hashes == {"/models/SM_Crate.blend": "xxh64:1"}
+    assert "/models/SM_Crate.blend" in prior
+
+
+def test_prior_results_dropped_when_rules_change(report_dir, monkeypatch):
+    write_hashes(report_dir, {"validator": validator_fingerprint(), "files": {"/models/SM_Crate.blend": "xxh64:1"}})
+    monkeypatch.setattr(validate_models, "MAX_BONES", 128)
+
+    assert load_prior_results(validator_fingerprint()) == ({}, {})
+
+
+def test_prior_results_dropped_after_blender_upgrade(report_dir, monkeypatch):
+    save_hashes(validator_fingerprint(), {"/models/SM_Crate.blend": "xxh64:1"})
+    monkeypatch.setattr(validate_models.bpy.app, "version_string", "4.3.0")
+
+    assert load_prior_results(validator_fingerprint()) == ({}, {})
+
+
+def test_save_hashes_round_trips(report_dir):
+    fingerprint = validator_fingerprint()
+    save_hashes(fingerprint, {"/models/SM_Crate.blend": "xxh64:1"})
+
+    assert load_prior_results(fingerprint)[1] == {"/models/SM_Crate.blend": "xxh64:1"}
+    assert not (report_dir / "hashes.tmp").exists()
+
+
+def test_prior_results_dropped_for_unversioned_hashes(report_dir):
+    write_hashes(report_dir, {"/models/SM_Crate.blend": "xxh64:1"})
+
+    assert load_prior_results(validator_fingerprint()) == ({}, {})